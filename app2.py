@@ -15,7 +15,9 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import datetime
+import bisect
 import io
+import json
 import altair as alt
 
 st.set_page_config(page_title="💎 Smart Habit Tracker", layout="wide")
@@ -24,61 +26,199 @@ st.title("💎 Smart Habit Tracker")
 # -----------------------
 # Helper functions
 # -----------------------
-def make_empty_df():
-    cols = ["date", "sleep", "healthy_food", "junk_food", "exercise", "water", "reading"]
-    return pd.DataFrame(columns=cols)
-
-def composite_score(row):
-    # Build a composite normalized score (higher is better)
-    # Normalize each metric to a 0-1 range using reasonable caps
-    s = min(row.get("sleep", 0) / 9.0, 1.0)           # 0-9 hours considered
-    hf = min(row.get("healthy_food", 0) / 5.0, 1.0)   # 5 portions ideal
-    jf = 1 - min(row.get("junk_food", 0) / 5.0, 1.0)   # fewer junk better
-    ex = min(row.get("exercise", 0) / 60.0, 1.0)      # 60 min ideal
-    w = min(row.get("water", 0) / 8.0, 1.0)           # 8 glasses ideal
-    r = min(row.get("reading", 0) / 60.0, 1.0)        # 60 min ideal
-    # Weighting
-    return 0.18*s + 0.18*hf + 0.12*jf + 0.2*ex + 0.16*w + 0.16*r
+NUMERIC_COLS = ("sleep", "healthy_food", "junk_food", "exercise", "water", "reading")
+# Compact storage dtypes; every metric's input range fits comfortably
+NUMERIC_DTYPES = {
+    "sleep": np.float32,
+    "healthy_food": np.int16,
+    "junk_food": np.int16,
+    "exercise": np.float32,
+    "water": np.int16,
+    "reading": np.float32,
+}
 
+# Store columns a custom habit must not shadow
+RESERVED_COLS = {"date", "score"} | set(NUMERIC_COLS)
+
+def make_empty_store():
+    # Column-oriented store: one list per column, appended to on save/import.
+    # "date" always holds np.datetime64[D] values; "score" holds each row's
+    # composite score, computed once when the row is added.
+    return {c: [] for c in ("date",) + NUMERIC_COLS + ("score",)}
+
+def narrow_values(col, values):
+    # List of column values, downcast to the compact dtype when that is lossless
+    dtype = NUMERIC_DTYPES.get(col)
+    if dtype is not None and np.issubdtype(values.dtype, np.number):
+        if np.issubdtype(values.dtype, np.floating) and not np.isfinite(values).all():
+            return values.tolist()  # NaN/inf can't be cast; keep the wide dtype
+        cast = values.astype(dtype)
+        if np.array_equal(cast, values):  # out-of-range or fractional values keep the wide dtype
+            return list(cast)
+    return values.tolist()
+
+def store_to_df(store):
+    # Materialize the column store as a DataFrame for display/analysis. The frame
+    # is kept in session_state and rebuilt only when data_version changes, which
+    # is far cheaper than hashing the store on every rerun.
+    cached = st.session_state.get("df_cache")
+    if cached is None or cached[0] != st.session_state.data_version:
+        cached = (st.session_state.data_version, pd.DataFrame(store))
+        st.session_state.df_cache = cached
+    return cached[1]
+
+# (metric, cap, weight) for the composite score; each metric is normalized to
+# a 0-1 range against its cap before weighting
+SCORE_WEIGHTS = (
+    ("sleep", 9.0, 0.18),          # 0-9 hours considered
+    ("healthy_food", 5.0, 0.18),   # 5 portions ideal
+    ("junk_food", 5.0, -0.12),     # fewer junk better: adds 0.12 * (1 - normalized)
+    ("exercise", 60.0, 0.2),       # 60 min ideal
+    ("water", 8.0, 0.16),          # 8 glasses ideal
+    ("reading", 60.0, 0.16),       # 60 min ideal
+)
+# Reciprocal caps, so normalizing is a multiply rather than a divide
+INV_CAPS = {col: 1.0 / cap for col, cap, _ in SCORE_WEIGHTS}
+
+def composite_scores(df):
+    # Build a composite normalized score (higher is better) for every row at once;
+    # df is a DataFrame or a dict of equal-length columns.
+    # All metrics accumulate into one output buffer via a single scratch array;
+    # the narrow source columns are read as-is and upcast into the float64 scratch.
+    n = len(df["sleep"])
+    out = np.full(n, 0.12)  # junk food baseline
+    tmp = np.empty(n)
+    for col, _, weight in SCORE_WEIGHTS:
+        np.multiply(np.asarray(df[col]), INV_CAPS[col], out=tmp, dtype=float)
+        np.minimum(tmp, 1.0, out=tmp)
+        tmp *= weight
+        out += tmp
+    return out
+
+def recent_rows(df, days):
+    # Rows dated within the last `days` days; the store is kept sorted by date,
+    # so a binary search finds the window start
+    dates = df["date"].to_numpy(dtype="datetime64[D]")  # no-op cast for datetime64 columns
+    cutoff = np.datetime64(datetime.date.today() - datetime.timedelta(days=days - 1), "D")
+    return df.iloc[np.searchsorted(dates, cutoff):]
+
+def metric_means(df):
+    # Per-metric averages (NaN-skipping) as a {metric: mean} dict
+    means = np.nanmean(df[list(NUMERIC_COLS)].to_numpy(dtype=float), axis=0)
+    return dict(zip(NUMERIC_COLS, means.tolist()))
+
+@st.cache_data(ttl=300, max_entries=32)
 def analyze_week(df_week):
     # Returns summary: averages, best day (by composite)
     if df_week.empty:
         return None
-    df = df_week.copy()
-    df["score"] = df.apply(composite_score, axis=1)
-    best_idx = df["score"].idxmax()
-    best_day = df.loc[best_idx, "date"]
-    averages = df[["sleep", "healthy_food", "junk_food", "exercise", "water", "reading"]].mean().to_dict()
-    return {"best_day": best_day, "averages": averages, "scores": df[["date","score"]].sort_values("date")}
+    best_idx = df_week["score"].idxmax()
+    best_day = df_week.loc[best_idx, "date"].date()
+    averages = metric_means(df_week)
+    return {"best_day": best_day, "averages": averages, "scores": df_week[["date","score"]]}
+
+# Suggestion rules: (metric, threshold, comparison, tip)
+RULES = [
+    ("sleep", 6, "<", "Try to increase sleep (aim for 7-9 hours). Consider a consistent bedtime."),
+    ("water", 6, "<", "Drink more water — target ~8 glasses daily. Set small reminders."),
+    ("exercise", 20, "<", "Add more movement — even 20–30 min of brisk walk helps."),
+    ("healthy_food", 3, "<", "Increase healthy food portions (fruits/veggies)."),
+    ("junk_food", 1, ">", "Reduce junk food frequency; swap one snack for fruit."),
+    ("reading", 15, "<", "Try a short daily reading habit — 10–20 minutes."),
+]
 
+@st.cache_data(ttl=300, max_entries=32)
 def suggestions_from_averages(avg):
     # Returns list of suggestion strings based on averages
-    tips = []
-    if avg["sleep"] < 6:
-        tips.append("Try to increase sleep (aim for 7-9 hours). Consider a consistent bedtime.")
-    if avg["water"] < 6:
-        tips.append("Drink more water — target ~8 glasses daily. Set small reminders.")
-    if avg["exercise"] < 20:
-        tips.append("Add more movement — even 20–30 min of brisk walk helps.")
-    if avg["healthy_food"] < 3:
-        tips.append("Increase healthy food portions (fruits/veggies).")
-    if avg["junk_food"] > 1:
-        tips.append("Reduce junk food frequency; swap one snack for fruit.")
-    if avg["reading"] < 15:
-        tips.append("Try a short daily reading habit — 10–20 minutes.")
+    tips = [msg for col, thr, op, msg in RULES if (avg[col] < thr if op == "<" else avg[col] > thr)]
     if not tips:
         tips.append("Great week! Keep up the balanced habits.")
     return tips
 
+def read_csv_upload(uploaded):
+    # Bulk-parse with the pyarrow reader when it is installed; fall back to the C engine
+    try:
+        return pd.read_csv(uploaded, engine="pyarrow")
+    except (ImportError, ValueError):
+        uploaded.seek(0)
+        return pd.read_csv(uploaded)
+
+@st.cache_data
+def build_plot_df(df, numeric_cols):
+    # Long form of the numeric columns for the Altair bar chart
+    return df[["date"] + numeric_cols].melt(id_vars=["date"], var_name="habit", value_name="value")
+
+@st.cache_data
+def build_bar_chart(plot_df):
+    return alt.Chart(plot_df).mark_bar().encode(
+        x=alt.X("date:T", title="Date"),
+        y=alt.Y("value:Q", title="Value"),
+        color=alt.Color("habit:N", legend=alt.Legend(title="Habit")),
+        tooltip=["date", "habit", "value"]
+    ).properties(height=400, width=800).interactive()
+
+@st.cache_data
+def build_score_chart(df_window):
+    return alt.Chart(df_window).mark_line(point=True).encode(
+        x=alt.X("date:T", title="Date"),
+        y=alt.Y("score:Q", title="Composite score (0-1)"),
+        tooltip=["date", alt.Tooltip("score:Q", format=".2f")]
+    ).properties(height=300, width=900)
+
+# Browser notification script; {TEXT} is filled in by build_notify_html
+NOTIFY_TEMPLATE = """
+<script>
+var reminderText = {TEXT};
+// Request permission then start interval notifications
+function startReminders() {
+  // never stack intervals if reminders are already running
+  if (window.reminder_interval) clearInterval(window.reminder_interval);
+  // show immediately and then every 60 sec
+  var n = new Notification(reminderText);
+  window.reminder_interval = window.setInterval(function() {
+      var n2 = new Notification(reminderText);
+  }, 60000);
+}
+function notifyMe() {
+  if (!("Notification" in window)) {
+    alert("This browser does not support desktop notification");
+  } else if (Notification.permission === "granted") {
+    startReminders();
+  } else if (Notification.permission !== "denied") {
+    Notification.requestPermission().then(function (permission) {
+      if (permission === "granted") {
+        startReminders();
+      } else {
+        alert("Notification permission denied.");
+      }
+    });
+  } else {
+    alert("Notification permission denied previously. Please enable in browser settings.");
+  }
+}
+notifyMe();
+</script>
+"""
+
+@st.cache_data
+def build_notify_html(text):
+    # json.dumps yields a quoted, escaped JS string literal; every "<" is escaped
+    # too so the text can't close the <script> tag or enter an HTML comment state
+    safe = json.dumps(text).replace("<", "\\u003c")
+    return NOTIFY_TEMPLATE.replace("{TEXT}", safe)
+
 # -----------------------
 # Session state init
 # -----------------------
 if "data" not in st.session_state:
-    st.session_state.data = make_empty_df()  # persistent only while session is open
+    st.session_state.data = make_empty_store()  # persistent only while session is open
 
 if "custom_habits" not in st.session_state:
     st.session_state.custom_habits = {}  # name -> ideal_cap (for normalization)
 
+if "data_version" not in st.session_state:
+    st.session_state.data_version = 0  # bumped on every change to the data store
+
 # -----------------------
 # Layout: Sidebar - Entry
 # -----------------------
@@ -100,7 +240,9 @@ custom_name = st.sidebar.text_input("Name (e.g., Meditation)")
 custom_value = st.sidebar.number_input("Value (numeric)", min_value=0.0, value=0.0, step=1.0, key="custom_value_input")
 custom_cap = st.sidebar.number_input("Ideal cap for normalization (e.g., 30 for minutes)", min_value=1.0, value=30.0, step=1.0)
 if st.sidebar.button("Add / Update Custom Habit"):
-    if custom_name.strip():
+    if custom_name.strip() in RESERVED_COLS:
+        st.sidebar.error(f"'{custom_name.strip()}' is a built-in column; please choose another name.")
+    elif custom_name.strip():
         st.session_state.custom_habits[custom_name.strip()] = float(custom_cap)
         # optionally we'll store custom values per entry; we prompt user to add them below via a dynamic UI
         st.sidebar.success(f"Saved custom habit '{custom_name.strip()}' with cap {custom_cap}.")
@@ -120,22 +262,28 @@ st.sidebar.markdown("---")
 if st.sidebar.button("💾 Save Entry"):
     # Build new entry dict (with custom habits stored in a JSON-like column)
     new = {
-        "date": pd.to_datetime(entry_date).date(),
-        "sleep": float(sleep),
-        "healthy_food": int(healthy_food),
-        "junk_food": int(junk_food),
-        "exercise": float(exercise),
-        "water": int(water),
-        "reading": float(reading),
+        "date": np.datetime64(entry_date, "D"),
+        "sleep": np.float32(sleep),
+        "healthy_food": np.int16(healthy_food),
+        "junk_food": np.int16(junk_food),
+        "exercise": np.float32(exercise),
+        "water": np.int16(water),
+        "reading": np.float32(reading),
     }
-    # Add custom columns to dataframe dynamically
-    for cname, val in custom_inputs.items():
-        if cname not in st.session_state.data.columns:
-            st.session_state.data[cname] = np.nan  # create new column
-        new[cname] = val
-    st.session_state.data = pd.concat([st.session_state.data, pd.DataFrame([new])], ignore_index=True)
-    # Ensure 'date' dtype consistent
-    st.session_state.data["date"] = pd.to_datetime(st.session_state.data["date"]).dt.date
+    new["score"] = composite_scores({k: [v] for k, v in new.items()})[0]
+    new.update(custom_inputs)
+    store = st.session_state.data
+    n = len(store["date"])
+    i = bisect.bisect_right(store["date"], new["date"])  # keep the store sorted by date
+    for k, v in new.items():
+        if k not in store:
+            store[k] = [np.nan] * n  # create new custom column, backfilled
+        store[k].insert(i, v)
+    # Keep columns this entry doesn't have (e.g. imported extras) aligned
+    for k, col in store.items():
+        if k not in new:
+            col.insert(i, np.nan)
+    st.session_state.data_version += 1
     st.success("✅ Entry saved!")
 
 # -----------------------
@@ -146,14 +294,44 @@ st.sidebar.subheader("💼 Import / Export")
 uploaded = st.sidebar.file_uploader("Upload CSV to import entries", type=["csv"])
 if uploaded is not None:
     try:
-        dfu = pd.read_csv(uploaded, parse_dates=["date"])
+        dfu = read_csv_upload(uploaded)
         # basic validation: must have date column
         if "date" not in dfu.columns:
             st.sidebar.error("CSV missing 'date' column.")
         else:
-            # append imported (dates normalized)
-            dfu["date"] = pd.to_datetime(dfu["date"]).dt.date
-            st.session_state.data = pd.concat([st.session_state.data, dfu], ignore_index=True)
+            # append imported (dates normalized to datetime64[D])
+            dfu["date"] = pd.to_datetime(dfu["date"])
+            # rows without a usable date would break the date-sorted store
+            n_bad = int(dfu["date"].isna().sum())
+            if n_bad:
+                dfu = dfu.dropna(subset=["date"])
+                st.sidebar.warning(f"Skipped {n_bad} row(s) with a missing or invalid date.")
+            dfu = dfu.sort_values("date", kind="stable")
+            for k in NUMERIC_COLS:
+                if k not in dfu.columns:
+                    dfu[k] = np.nan  # missing metrics are padded, as in the store
+            dfu["score"] = composite_scores(dfu)  # never trust a score column from the file
+            dates = dfu["date"].values.astype("datetime64[D]")
+            store = st.session_state.data
+            n, m = len(store["date"]), len(dfu)
+            # imports dated after the existing entries can simply be appended
+            in_order = n == 0 or m == 0 or dates[0] >= store["date"][-1]
+            for k in dfu.columns:
+                if k not in store:
+                    store[k] = [np.nan] * n  # backfill new columns
+            for k, col in store.items():
+                if k == "date":
+                    col.extend(dates)
+                elif k in dfu.columns:
+                    col.extend(narrow_values(k, dfu[k].to_numpy()))
+                else:
+                    col.extend([np.nan] * m)
+            if not in_order:
+                # re-sort all columns by date (stable, so same-day entries keep their order)
+                order = np.argsort(np.asarray(store["date"]), kind="stable")
+                for k in store:
+                    store[k] = [store[k][j] for j in order]
+            st.session_state.data_version += 1
             st.sidebar.success("Imported entries added to session data.")
     except Exception as e:
         st.sidebar.error(f"Failed to import CSV: {e}")
@@ -161,185 +339,158 @@ if uploaded is not None:
 # Download CSV
 def get_csv_bytes(df):
     out = io.BytesIO()
-    df.to_csv(out, index=False)
+    df.drop(columns="score").to_csv(out, index=False)
     return out.getvalue()
 
-if not st.session_state.data.empty:
-    csv_bytes = get_csv_bytes(st.session_state.data)
+if st.session_state.data["date"]:
+    # Serialize only when the data changed since the CSV was last built
+    cached = st.session_state.get("csv_cache")
+    if cached is None or cached[0] != st.session_state.data_version:
+        cached = (st.session_state.data_version, get_csv_bytes(store_to_df(st.session_state.data)))
+        st.session_state.csv_cache = cached
+    csv_bytes = cached[1]
     st.sidebar.download_button("⬇️ Download CSV", data=csv_bytes, file_name="habit_data.csv", mime="text/csv")
 
 if st.sidebar.button("🗑️ Clear all session data"):
-    st.session_state.data = make_empty_df()
+    st.session_state.data = make_empty_store()
+    st.session_state.data_version += 1
     st.success("Session data cleared.")
 
 # -----------------------
-# Main area: Display and analysis
+# Simple browser reminders (JS component)
 # -----------------------
-st.subheader("📊 Display your data")
-if st.session_state.data.empty:
-    st.info("No data yet — add an entry from the left sidebar.")
-else:
-    df = st.session_state.data.copy()
-    df = df.sort_values("date")
-    # show table (first columns visible)
-    st.dataframe(df.style.format({c: "{:.1f}" for c in df.select_dtypes(include=[np.number]).columns}))
+@st.fragment  # reminder widgets rerun only this section, not the analysis above
+def reminders_section():
+    st.markdown("---")
+    st.subheader("⏰ Reminders (browser notifications while page is open)")
+    remind_water = st.checkbox("Remind me to drink water every 60 seconds while page is open")
+    remind_custom_text = st.text_input("Reminder text (optional)", "Time to hydrate! 💧")
+
+    # A bit of JS to ask notification permission and (if checked) show repeated reminders while open.
+    # This will only work while the user keeps the Streamlit tab open.
+    if remind_water and st.button("▶️ Enable reminders"):
+        # Insert a small script; note: streamlit.components.v1.html allowed
+        notify_js = build_notify_html(remind_custom_text)
+        st.components.v1.html(notify_js, scrolling=False)
+
+    if st.button("⏹️ Stop reminders (clears interval)"):
+        clear_js = """
+        <script>
+        if (window.reminder_interval) {
+            clearInterval(window.reminder_interval);
+            window.reminder_interval = null;
+            alert("Reminders stopped.");
+        } else {
+            alert("No active reminders found.");
+        }
+        </script>
+        """
+        st.components.v1.html(clear_js)
 
-    # Show time range controls
+# -----------------------
+# Footer + credits
+# -----------------------
+def footer():
     st.markdown("---")
-    st.subheader("📈 Plot your habits over time")
-    col1, col2 = st.columns([2,1])
-
-    with col1:
-        # Melt numeric columns into long form for plotting (skip custom non-numeric)
-        numeric_cols = [c for c in df.columns if c != "date" and np.issubdtype(df[c].dropna().dtype, np.number) or c in ["sleep","exercise","water","reading","healthy_food","junk_food"]]
-        # ensure numeric_cols includes typical ones
-        plot_df = df[["date"] + numeric_cols].melt(id_vars=["date"], var_name="habit", value_name="value")
-        chart = alt.Chart(plot_df).mark_bar().encode(
-            x=alt.X("date:T", title="Date"),
-            y=alt.Y("value:Q", title="Value"),
-            color=alt.Color("habit:N", legend=alt.Legend(title="Habit")),
-            tooltip=["date", "habit", "value"]
-        ).properties(height=400, width=800).interactive()
-        st.altair_chart(chart, use_container_width=True)
-
-    with col2:
-        # Weekly summary (last 7 days)
-        st.subheader("Weekly analysis (last 7 days)")
-        last_7 = df[df["date"] >= (datetime.date.today() - datetime.timedelta(days=6))]
-        analysis = analyze_week(last_7)
-        if analysis is None:
-            st.write("Not enough data in the last 7 days.")
-        else:
-            best_day = analysis["best_day"]
-            st.metric("Best day (by composite score)", str(best_day))
-            avgs = analysis["averages"]
-            st.write("Averages (last 7 days):")
-            avg_df = pd.DataFrame.from_dict(avgs, orient="index", columns=["average"]).round(2)
-            st.table(avg_df)
-
-            # Suggestions
-            st.write("Suggestions:")
-            for tip in suggestions_from_averages(avgs):
-                st.write("•", tip)
-
-            # Low-performance alerts
-            alerts = []
-            if avgs["water"] < 5:
-                alerts.append("Low average water intake — consider setting water reminders.")
-            if avgs["sleep"] < 6:
-                alerts.append("Low average sleep — consistent schedule may help.")
-            if avgs["exercise"] < 15:
-                alerts.append("Low average exercise minutes.")
-            if alerts:
-                for a in alerts:
-                    st.warning(a)
+    st.caption("Built with Streamlit • This session stores data only while the app is open (use Export to save).")
 
 # -----------------------
-# Composite weekly scoring visual
+# Main area: Display and analysis
 # -----------------------
+st.subheader("📊 Display your data")
+if not st.session_state.data["date"]:
+    # Nothing to analyze: show the empty state and skip the rest of the rerun
+    st.info("No data yet — add an entry from the left sidebar.")
+    reminders_section()
+    footer()
+    st.stop()
+
+df = store_to_df(st.session_state.data)  # already sorted by date
+# show table (first columns visible)
+st.dataframe(
+    df.round(1),
+    column_config={"date": st.column_config.DateColumn("date")},
+    column_order=[c for c in df.columns if c != "score"],
+)
+
+# Show time range controls
 st.markdown("---")
-st.subheader("📌 Weekly composite scores")
-if not st.session_state.data.empty:
-    last_14 = st.session_state.data.copy()
-    last_14["date"] = pd.to_datetime(last_14["date"]).dt.date
-    last_30 = last_14[last_14["date"] >= (datetime.date.today() - datetime.timedelta(days=29))]
-    if last_30.empty:
-        st.write("No recent data.")
+st.subheader("📈 Plot your habits over time")
+col1, col2 = st.columns([2,1])
+
+with col1:
+    # Melt numeric columns into long form for plotting (skip custom non-numeric)
+    known_numeric = set(NUMERIC_COLS) | set(st.session_state.custom_habits)
+    numeric_cols = [c for c in df.columns if c != "date" and c in known_numeric]
+    plot_df = build_plot_df(df, numeric_cols)
+    chart = build_bar_chart(plot_df)
+    st.altair_chart(chart, use_container_width=True)
+
+with col2:
+    # Weekly summary (last 7 days)
+    st.subheader("Weekly analysis (last 7 days)")
+    last_7 = recent_rows(df, 7)
+    analysis = analyze_week(last_7)
+    if analysis is None:
+        st.write("Not enough data in the last 7 days.")
     else:
-        last_30["score"] = last_30.apply(composite_score, axis=1)
-        score_chart = alt.Chart(last_30).mark_line(point=True).encode(
-            x=alt.X("date:T", title="Date"),
-            y=alt.Y("score:Q", title="Composite score (0-1)"),
-            tooltip=["date", alt.Tooltip("score:Q", format=".2f")]
-        ).properties(height=300, width=900)
-        st.altair_chart(score_chart, use_container_width=True)
+        best_day = analysis["best_day"]
+        st.metric("Best day (by composite score)", str(best_day))
+        avgs = analysis["averages"]
+        st.write("Averages (last 7 days):")
+        avg_df = pd.DataFrame.from_dict(avgs, orient="index", columns=["average"]).round(2)
+        st.table(avg_df)
+
+        # Suggestions
+        st.write("Suggestions:")
+        for tip in suggestions_from_averages(avgs):
+            st.write("•", tip)
+
+        # Low-performance alerts
+        alerts = []
+        if avgs["water"] < 5:
+            alerts.append("Low average water intake — consider setting water reminders.")
+        if avgs["sleep"] < 6:
+            alerts.append("Low average sleep — consistent schedule may help.")
+        if avgs["exercise"] < 15:
+            alerts.append("Low average exercise minutes.")
+        if alerts:
+            for a in alerts:
+                st.warning(a)
 
 # -----------------------
-# Simple browser reminders (JS component)
+# Composite weekly scoring visual
 # -----------------------
 st.markdown("---")
-st.subheader("⏰ Reminders (browser notifications while page is open)")
-remind_water = st.checkbox("Remind me to drink water every 60 seconds while page is open")
-remind_custom_text = st.text_input("Reminder text (optional)", "Time to hydrate! 💧")
-
-# A bit of JS to ask notification permission and (if checked) show repeated reminders while open.
-# This will only work while the user keeps the Streamlit tab open.
-if remind_water and st.button("▶️ Enable reminders"):
-    # Insert a small script; note: streamlit.components.v1.html allowed
-    notify_js = f"""
-    <script>
-    // Request permission then start interval notifications
-    function notifyMe() {{
-      if (!("Notification" in window)) {{
-        alert("This browser does not support desktop notification");
-      }} else if (Notification.permission === "granted") {{
-        // show immediately and then every 60 sec
-        var n = new Notification("{remind_custom_text}");
-        window.reminder_interval = window.setInterval(function() {{
-            var n2 = new Notification("{remind_custom_text}");
-        }}, 60000);
-      }} else if (Notification.permission !== "denied") {{
-        Notification.requestPermission().then(function (permission) {{
-          if (permission === "granted") {{
-            var n = new Notification("{remind_custom_text}");
-            window.reminder_interval = window.setInterval(function() {{
-                var n2 = new Notification("{remind_custom_text}");
-            }}, 60000);
-          }} else {{
-            alert("Notification permission denied.");
-          }}
-        }});
-      }} else {{
-        alert("Notification permission denied previously. Please enable in browser settings.");
-      }}
-    }}
-    notifyMe();
-    </script>
-    """
-    st.components.v1.html(notify_js)
-
-if st.button("⏹️ Stop reminders (clears interval)"):
-    clear_js = """
-    <script>
-    if (window.reminder_interval) {
-        clearInterval(window.reminder_interval);
-        window.reminder_interval = null;
-        alert("Reminders stopped.");
-    } else {
-        alert("No active reminders found.");
-    }
-    </script>
-    """
-    st.components.v1.html(clear_js)
+st.subheader("📌 Weekly composite scores")
+last_30 = recent_rows(df, 30)
+if last_30.empty:
+    st.write("No recent data.")
+else:
+    score_chart = build_score_chart(last_30)
+    st.altair_chart(score_chart, use_container_width=True)
+
+reminders_section()
 
 # -----------------------
 # Extra: Quick insights and tips (auto-generated)
 # -----------------------
 st.markdown("---")
 st.subheader("🔎 Quick Insights & Tips")
-if st.session_state.data.empty:
-    st.write("Add entries to get personalized insights.")
+recent = recent_rows(df, 7)
+if recent.empty:
+    st.write("Not enough recent data for insights (last 7 days).")
 else:
-    df_all = st.session_state.data.copy()
-    df_all["date"] = pd.to_datetime(df_all["date"]).dt.date
-    recent = df_all[df_all["date"] >= (datetime.date.today() - datetime.timedelta(days=6))]
-    if recent.empty:
-        st.write("Not enough recent data for insights (last 7 days).")
-    else:
-        rec_avg = recent[["sleep","healthy_food","junk_food","exercise","water","reading"]].mean().to_dict()
-        # Show two quick rules
-        if rec_avg["junk_food"] > 2:
-            st.info("You've eaten junk food more than 2 times/day on average — try healthier swaps on 1-2 days.")
-        if rec_avg["reading"] >= 30:
-            st.success("Nice reading habit — you're averaging >=30 minutes per day!")
-        # Custom habit highlight
-        for cname in st.session_state.custom_habits.keys():
-            if cname in recent.columns:
-                val = recent[cname].mean()
-                st.write(f"Custom habit '{cname}' average (last 7d): {val:.1f} (cap {st.session_state.custom_habits[cname]})")
+    rec_avg = metric_means(recent)
+    # Show two quick rules
+    if rec_avg["junk_food"] > 2:
+        st.info("You've eaten junk food more than 2 times/day on average — try healthier swaps on 1-2 days.")
+    if rec_avg["reading"] >= 30:
+        st.success("Nice reading habit — you're averaging >=30 minutes per day!")
+    # Custom habit highlight
+    for cname in st.session_state.custom_habits.keys():
+        if cname in recent.columns:
+            val = recent[cname].mean()
+            st.write(f"Custom habit '{cname}' average (last 7d): {val:.1f} (cap {st.session_state.custom_habits[cname]})")
 
-# -----------------------
-# Footer + credits
-# -----------------------
-st.markdown("---")
-st.caption("Built with Streamlit • This session stores data only while the app is open (use Export to save).")
+footer()